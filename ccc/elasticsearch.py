@@ -9,6 +9,7 @@ import functools
 import json
 import logging
 import os
+import typing
 
 import elasticsearch
 
@@ -210,3 +211,38 @@ def metric_to_es(
         import traceback
         logger.warning(traceback.format_exc())
         logger.warning('could not send route request to elastic search')
+
+
+def metrics_to_es(
+    es_client: ElasticSearchClient,
+    metrics: typing.Iterable,
+    index_name: str,
+    batch_size: int=500,
+):
+    '''stores the given metrics (dataclass-instances) via the bulk-API, in batches'''
+    batch = []
+    for metric in metrics:
+        batch.append(dataclasses.asdict(metric))
+        if len(batch) >= batch_size:
+            _store_metrics_batch(es_client=es_client, documents=batch, index_name=index_name)
+            batch = []
+
+    if batch:
+        _store_metrics_batch(es_client=es_client, documents=batch, index_name=index_name)
+
+
+def _store_metrics_batch(
+    es_client: ElasticSearchClient,
+    documents: list[dict],
+    index_name: str,
+):
+    try:
+        es_client.store_documents(
+            index=index_name,
+            body=documents,
+            inject_metadata=False,
+        )
+    except Exception:
+        import traceback
+        logger.warning(traceback.format_exc())
+        logger.warning('could not send route request to elastic search')
@@ -1,5 +1,6 @@
 import functools
 import logging
+import threading
 import urllib
 
 import google.oauth2.service_account as service_account
@@ -88,21 +89,37 @@ def qualified_service_account_key_name(
     return f'{base_name}/keys/{key_name}'
 
 
+# iam-clients, keyed by (cfg-element-type-name, cfg-element-name); clients are reused across
+# rotations sharing the same rotation-cfg (avoids re-fetching + re-parsing discovery-docs)
+_iam_clients = {}
+_iam_clients_lock = threading.Lock()
+
+
 def create_iam_client(
     cfg_element: model.container_registry.ContainerRegistryConfig | model.gcp.GcpServiceAccount,
 ) -> googleapiclient.discovery.Resource:
-    if isinstance(cfg_element, model.container_registry.ContainerRegistryConfig):
-        credentials = cfg_element.credentials().service_account_credentials()
-    elif isinstance(cfg_element, model.gcp.GcpServiceAccount):
-        credentials = cfg_element.service_account_credentials()
-    else:
-        raise NotImplementedError
-
-    return googleapiclient.discovery.build(
-        serviceName='iam',
-        version='v1',
-        credentials=credentials,
-    )
+    client_key = (type(cfg_element).__name__, cfg_element.name())
+
+    with _iam_clients_lock:
+        if (iam_client := _iam_clients.get(client_key)):
+            return iam_client
+
+        if isinstance(cfg_element, model.container_registry.ContainerRegistryConfig):
+            credentials = cfg_element.credentials().service_account_credentials()
+        elif isinstance(cfg_element, model.gcp.GcpServiceAccount):
+            credentials = cfg_element.service_account_credentials()
+        else:
+            raise NotImplementedError
+
+        iam_client = googleapiclient.discovery.build(
+            serviceName='iam',
+            version='v1',
+            credentials=credentials,
+            static_discovery=True, # use bundled discovery-doc instead of fetching it
+        )
+        _iam_clients[client_key] = iam_client
+
+    return iam_client
 
 
 class GrafeasClient:
@@ -3,29 +3,34 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import atexit
 import datetime
 import enum
 import functools
 import logging
+import queue
+import threading
+import time
 import traceback
 import typing
 import urllib.parse
+import weakref
 
-import cachecontrol
 import deprecated
-import gci.componentmodel as cm
-import github3
-import github3.github
-import github3.session
 
-import ccc.elasticsearch
 import ci.util
-import github.util
-import http_requests
 import model
 import model.github
 import model.base
 
+# heavyweight modules (github3, cachecontrol, elasticsearch, ..) are imported lazily within
+# the functions using them - many callers only need cfg-lookups, and import-cost dominates
+# CLI cold-start
+if typing.TYPE_CHECKING:
+    import cachecontrol.cache
+    import gci.componentmodel as cm
+    import github3.github
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,13 +38,111 @@ class SessionAdapter(enum.Enum):
     NONE = None
     RETRY = 'retry'
     CACHE = 'cache'
+    RETRY_CACHE = 'retry-cache'
+
+
+_es_log_queue = queue.Queue(maxsize=10_000)
+_es_log_worker = None
+_es_log_worker_lock = threading.Lock()
+_es_log_max_batch_size = 200
+_es_log_max_batch_delay_seconds = 0.5
+
+
+def _store_es_log_documents(
+    items: typing.Sequence[tuple['ccc.elasticsearch.ElasticSearchClient', str, dict]],
+):
+    batches = {} # (client-id, index) -> (es_client, index, [documents])
+    for es_client, index, document in items:
+        batch = batches.setdefault((id(es_client), index), (es_client, index, []))
+        batch[2].append(document)
+
+    for es_client, index, documents in batches.values():
+        try:
+            es_client.store_documents(
+                index=index,
+                body=documents,
+            )
+        except Exception as e:
+            logger.debug(f'failed to store {len(documents)} documents to {index=}: {e}')
+
+
+def _es_log_worker_run():
+    while True:
+        items = [_es_log_queue.get()]
+        deadline = time.monotonic() + _es_log_max_batch_delay_seconds
+        while len(items) < _es_log_max_batch_size:
+            try:
+                items.append(
+                    _es_log_queue.get(timeout=max(0, deadline - time.monotonic()))
+                )
+            except queue.Empty:
+                break
+
+        _store_es_log_documents(items)
+
+
+def _flush_es_log_queue():
+    items = []
+    while True:
+        try:
+            items.append(_es_log_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    if items:
+        _store_es_log_documents(items)
+
+
+def _enqueue_es_log_document(
+    es_client,
+    index: str,
+    body: dict,
+):
+    '''enqueues the given document for asynchronous (batched) storing to Elasticsearch
+
+    raises `queue.Full` if the queue limit is exceeded (e.g. because Elasticsearch cannot
+    keep up / is unreachable) - callers are expected to disable logging in this case.
+    '''
+    global _es_log_worker
+    if not _es_log_worker or not _es_log_worker.is_alive():
+        with _es_log_worker_lock:
+            if not _es_log_worker or not _es_log_worker.is_alive():
+                _es_log_worker = threading.Thread(
+                    target=_es_log_worker_run,
+                    name='es-log-worker',
+                    daemon=True,
+                )
+                _es_log_worker.start()
+                atexit.register(_flush_es_log_queue)
+
+    _es_log_queue.put_nowait((es_client, index, body))
+
+
+@functools.lru_cache(maxsize=64)
+def _host_of(url: str) -> tuple[typing.Optional[str], urllib.parse.SplitResult]:
+    '''returns (hostname, parse-result) for the given url
+
+    cached, as the same urls recur frequently (urlsplit also skips the params-field
+    urlparse would additionally process)
+    '''
+    parsed = urllib.parse.urlsplit(url)
+    return parsed.hostname, parsed
+
+
+@functools.lru_cache()
+def _default_etag_cache() -> 'cachecontrol.cache.BaseCache':
+    import cachecontrol.cache
+
+    # process-global cache, so all sessions share ETags / cached responses
+    # (conditional requests yielding 304 do not count against github's rate-limit)
+    return cachecontrol.cache.DictCache()
 
 
 def github_api_ctor(
     github_cfg: model.github.GithubConfig,
     github_username: str,
     verify_ssl: bool=True,
-    session_adapter: SessionAdapter=SessionAdapter.RETRY,
+    session_adapter: SessionAdapter=SessionAdapter.RETRY_CACHE,
     cfg_factory: model.ConfigFactory=None,
 ):
     '''returns the appropriate github3.GitHub constructor for the given github URL
@@ -50,17 +153,24 @@ def github_api_ctor(
 
     github-api requests will be logged to Elasticsearch if a default Elasticsearch config is found.
     '''
+    import cachecontrol
+    import github3.github
+    import github3.session
+
+    import ccc.elasticsearch
+    import http_requests
+
     github_url = github_cfg.http_url()
 
-    parsed = urllib.parse.urlparse(github_url)
-    if parsed.scheme:
-        hostname = parsed.hostname
-    else:
+    hostname, parsed = _host_of(github_url)
+    if not parsed.scheme:
         raise ValueError('failed to parse url: ' + str(github_url))
 
     session = github3.session.GitHubSession()
     original_request = session.request
 
+    github_cfg_name = github_cfg.name() # static part of log-documents - hoist out of hot path
+
     def intercepted_request(
         method: str,
         url: str,
@@ -69,14 +179,15 @@ def github_api_ctor(
         req = original_request(method, url, **kwargs)
 
         try:
-            es_client.store_document(
+            _enqueue_es_log_document(
+                es_client=es_client,
                 index='github_request',
                 body={
                     'method': method,
                     'url': url,
                     'data': kwargs,
                     'creation_date': datetime.datetime.now().isoformat(),
-                    'github_cfg': github_cfg.name(),
+                    'github_cfg': github_cfg_name,
                     'github_hostname': hostname,
                     'github_username': github_username,
                 },
@@ -112,10 +223,17 @@ def github_api_ctor(
             session,
             cache_etags=True,
         )
+    elif session_adapter is SessionAdapter.RETRY_CACHE:
+        session = http_requests.mount_default_adapter(
+            session=session,
+            flags=http_requests.AdapterFlag.RETRY | http_requests.AdapterFlag.CACHE,
+            max_pool_size=16, # increase with care, might cause github api "secondary-rate-limit"
+            cache=_default_etag_cache(),
+        )
     else:
         raise NotImplementedError
 
-    if hostname.lower() == 'github.com':
+    if hostname == 'github.com': # urllib yields lowercase hostnames
         return functools.partial(
             github3.github.GitHub,
             session=session,
@@ -134,8 +252,10 @@ def repo_helper(
     org: str,
     repo: str,
     branch: str='master',
-    session_adapter: SessionAdapter=SessionAdapter.RETRY,
+    session_adapter: SessionAdapter=SessionAdapter.RETRY_CACHE,
 ):
+    import github.util
+
     api = github_api(
         github_cfg=github_cfg_for_repo_url(repo_url=ci.util.urljoin(host, org, repo)),
         session_adapter=session_adapter,
@@ -153,8 +273,10 @@ def pr_helper(
     host: str,
     org: str,
     repo: str,
-    session_adapter: SessionAdapter=SessionAdapter.RETRY,
+    session_adapter: SessionAdapter=SessionAdapter.RETRY_CACHE,
 ):
+    import github.util
+
     api = github_api(
         github_cfg=github_cfg_for_repo_url(repo_url=ci.util.urljoin(host, org, repo)),
         session_adapter=session_adapter,
@@ -171,10 +293,50 @@ def pr_helper(
 github_repo_helper = repo_helper
 
 
+@functools.lru_cache(maxsize=64)
+def _github_api(
+    github_cfg_name: str,
+    session_adapter: SessionAdapter,
+    cfg_factory,
+    username: str,
+):
+    github_cfg = cfg_factory.github(github_cfg_name)
+
+    github_credentials = github_cfg.credentials(username)
+
+    github_auth_token = github_credentials.auth_token()
+    github_username = github_credentials.username()
+
+    verify_ssl = github_cfg.tls_validation()
+
+    github_ctor = github_api_ctor(
+        github_cfg=github_cfg,
+        github_username=github_username,
+        verify_ssl=verify_ssl,
+        session_adapter=session_adapter,
+        cfg_factory=cfg_factory,
+    )
+    github_api = github_ctor(
+        token=github_auth_token,
+    )
+
+    if not github_api:
+        ci.util.fail(f'Could not connect to GitHub-instance {github_cfg.http_url()}')
+
+    if not 'github.com' in github_cfg.api_url():
+        github_api._github_url = github_cfg.api_url()
+
+    return github_api
+
+
+def reset_github_api_cache():
+    _github_api.cache_clear()
+
+
 def github_api(
     github_cfg: model.github.GithubConfig=None,
     repo_url: str=None,
-    session_adapter: SessionAdapter=SessionAdapter.RETRY,
+    session_adapter: SessionAdapter=SessionAdapter.RETRY_CACHE,
     cfg_factory=None,
     username: typing.Optional[str]=None,
 ):
@@ -197,34 +359,40 @@ def github_api(
             cfg_factory=cfg_factory,
         )
 
-    if username:
-        github_credentials = github_cfg.credentials(username)
-    else:
-        github_credentials = github_cfg.credentials_with_most_remaining_quota()
+    if not username:
+        # re-evaluate quota-based selection for each lookup (cheap - the selection itself is
+        # ttl-cached), so technical users are still failed-over as quotas deplete; clients
+        # are reused per resolved user
+        username = github_cfg.credentials_with_most_remaining_quota().username()
+
+    # construction is memoised (keyed by cfg-name and username), so repeated lookups share
+    # one client (and thus its connection-pool and etag-cache)
+    return _github_api(
+        github_cfg_name=github_cfg.name(),
+        session_adapter=SessionAdapter(session_adapter),
+        cfg_factory=cfg_factory,
+        username=username,
+    )
 
-    github_auth_token = github_credentials.auth_token()
-    github_username = github_credentials.username()
 
-    verify_ssl = github_cfg.tls_validation()
+# per-cfg-factory index: hostname -> [GithubConfig] (avoids linear scans for hot lookups)
+_github_cfgs_by_hostname = weakref.WeakKeyDictionary()
 
-    github_ctor = github_api_ctor(
-        github_cfg=github_cfg,
-        github_username=github_username,
-        verify_ssl=verify_ssl,
-        session_adapter=session_adapter,
-        cfg_factory=cfg_factory,
-    )
-    github_api = github_ctor(
-        token=github_auth_token,
-    )
 
-    if not github_api:
-        ci.util.fail(f'Could not connect to GitHub-instance {github_cfg.http_url()}')
+def _github_cfgs_for_hostname(
+    cfg_factory,
+    hostname: str,
+) -> tuple[model.github.GithubConfig, ...]:
+    if (index := _github_cfgs_by_hostname.get(cfg_factory)) is None:
+        index = {}
+        for github_cfg in cfg_factory._cfg_elements(cfg_type_name='github'):
+            if not (cfg_hostname := github_cfg.hostname()):
+                continue
+            index.setdefault(cfg_hostname, []).append(github_cfg)
 
-    if not 'github.com' in github_cfg.api_url():
-        github_api._github_url = github_cfg.api_url()
+        _github_cfgs_by_hostname[cfg_factory] = index
 
-    return github_api
+    return tuple(index.get(hostname.lower(), ()))
 
 
 @functools.lru_cache()
@@ -241,22 +409,29 @@ def github_cfg_for_repo_url(
     if not cfg_factory:
         cfg_factory = ci.util.ctx().cfg_factory()
 
+    required_labels = set(require_labels) if require_labels else None
+
+    if not (hostname := ci.util.urlparse(repo_url).hostname):
+        raise model.base.ConfigElementNotFoundError(f'No github cfg found for {repo_url=}')
+
     matching_cfgs = []
-    for github_cfg in cfg_factory._cfg_elements(cfg_type_name='github'):
-        if require_labels:
-            missing_labels = set(require_labels) - set(github_cfg.purpose_labels())
+    for github_cfg in _github_cfgs_for_hostname(cfg_factory=cfg_factory, hostname=hostname):
+        if required_labels:
+            missing_labels = required_labels - github_cfg.purpose_labels()
             if missing_labels:
                 # if not all required labels are present skip this element
                 continue
         if github_cfg.matches_repo_url(repo_url=repo_url):
             matching_cfgs.append(github_cfg)
 
-    # prefer config with most configured repo urls
-    matching_cfgs = sorted(matching_cfgs, key=lambda config: len(config.repo_urls()))
     if len(matching_cfgs) == 0:
         raise model.base.ConfigElementNotFoundError(f'No github cfg found for {repo_url=}')
 
-    gh_cfg = matching_cfgs[-1]
+    # prefer config with most configured repo urls (tie-break by position, as stable-sort did)
+    gh_cfg = max(
+        enumerate(matching_cfgs),
+        key=lambda indexed_cfg: (len(indexed_cfg[1].repo_urls()), indexed_cfg[0]),
+    )[1]
     logger.debug(f'using {gh_cfg.name()=} for {repo_url=}')
     return gh_cfg
 
@@ -276,22 +451,38 @@ def github_cfg_for_hostname(
     if isinstance(require_labels, str):
         require_labels = tuple(require_labels)
 
+    required_labels = set(require_labels) if require_labels else None
+
     def has_required_labels(github_cfg):
-        if not require_labels:
+        if not required_labels:
             return True
 
-        for required_label in require_labels:
-            if required_label not in github_cfg.purpose_labels():
-                return False
-        return True
+        return required_labels.issubset(github_cfg.purpose_labels())
 
-    for github_cfg in filter(has_required_labels, cfg_factory._cfg_elements(cfg_type_name='github')):
-        if github_cfg.matches_hostname(host_name=host_name):
+    for github_cfg in _github_cfgs_for_hostname(cfg_factory=cfg_factory, hostname=host_name):
+        if has_required_labels(github_cfg):
             return github_cfg
 
     raise RuntimeError(f'no github_cfg for {host_name} with {require_labels}')
 
 
+@functools.lru_cache()
+def _stacktrace_es_client(config_set_name: str):
+    '''resolves (and caches) the elasticsearch-client for stacktrace-logging
+
+    returns None if the config-set is not available (e.g. external concourse)
+    '''
+    import ccc.elasticsearch
+
+    try:
+        config_set = ci.util.ctx().cfg_factory().cfg_set(config_set_name)
+    except KeyError:
+        # do nothing: external concourse does not have config set 'internal_active'
+        return None
+
+    return ccc.elasticsearch.from_cfg(elasticsearch_cfg=config_set.elasticsearch())
+
+
 def log_stack_trace_information_hook(resp, *args, **kwargs):
     '''
     This function stores the current stacktrace in elastic search.
@@ -302,26 +493,24 @@ def log_stack_trace_information_hook(resp, *args, **kwargs):
 
     config_set_name = ci.util.check_env('CONCOURSE_CURRENT_CFG')
     try:
-        els_index = 'github_access_stacktrace'
-        try:
-            config_set = ci.util.ctx().cfg_factory().cfg_set(config_set_name)
-        except KeyError:
-            # do nothing: external concourse does not have config set 'internal_active'
+        elastic_client = _stacktrace_es_client(config_set_name)
+        if not elastic_client:
             return
-        elastic_cfg = config_set.elasticsearch()
 
         now = datetime.datetime.utcnow()
         json_body = {
             'date': now.isoformat(),
             'url': resp.url,
             'req_method': resp.request.method,
-            'stacktrace': traceback.format_stack()
+            # bound stack-depth - full stacks are expensive to extract and rarely needed
+            'stacktrace': traceback.format_list(traceback.extract_stack(limit=20)),
         }
 
-        elastic_client = ccc.elasticsearch.from_cfg(elasticsearch_cfg=elastic_cfg)
-        elastic_client.store_document(
-            index=els_index,
-            body=json_body
+        # store asynchronously (batched) - do not block the github-response on an ES RTT
+        _enqueue_es_log_document(
+            es_client=elastic_client,
+            index='github_access_stacktrace',
+            body=json_body,
         )
 
     except Exception as e:
@@ -329,8 +518,10 @@ def log_stack_trace_information_hook(resp, *args, **kwargs):
 
 
 def github_api_from_gh_access(
-    access: cm.GithubAccess,
-) -> typing.Union[github3.github.GitHub, github3.github.GitHubEnterprise]:
+    access: 'cm.GithubAccess',
+) -> typing.Union['github3.github.GitHub', 'github3.github.GitHubEnterprise']:
+    import gci.componentmodel as cm
+
     if access.type is not cm.AccessType.GITHUB:
         raise ValueError(f'{access=}')
 
@@ -1,4 +1,3 @@
-import copy
 import dataclasses
 import datetime
 import dateutil.parser
@@ -95,7 +94,9 @@ def rotate_cfg_element(
     )
     access_key = response.AccessKey
 
-    raw_cfg = copy.deepcopy(cfg_element.raw)
+    # shallow copy suffices: only top-level keys are replaced (no in-place mutation of
+    # nested containers)
+    raw_cfg = {**cfg_element.raw}
     new_element = model.alicloud.AlicloudConfig(
         name=cfg_element.name(), raw_dict=raw_cfg, type_name=cfg_element._type_name
     )
@@ -1,4 +1,3 @@
-import copy
 import dataclasses
 import datetime
 import logging
@@ -96,7 +95,9 @@ def rotate_cfg_element(
     )
     access_key = response.AccessKey
 
-    raw_cfg = copy.deepcopy(cfg_element.raw)
+    # shallow copy suffices: only top-level keys are replaced (no in-place mutation of
+    # nested containers)
+    raw_cfg = {**cfg_element.raw}
     new_element = model.aws.AwsProfile(
         name=cfg_element.name(), raw_dict=raw_cfg, type_name=cfg_element._type_name
     )
@@ -114,6 +115,14 @@ def rotate_cfg_element(
 
     secret_id = {'accessKeyId': cfg_element.access_key_id()}
 
+    if rotation_cfg is not cfg_element:
+        # remember which cfg-element was used for rotation, so the (later) deletion of the old
+        # key does not have to re-resolve the reference
+        secret_id['rotation_cfg'] = {
+            'type_name': rotation_cfg._type_name,
+            'element_name': rotation_cfg.name(),
+        }
+
     return revert_function, secret_id, new_element
 
 
@@ -122,10 +131,18 @@ def delete_config_secret(
     cfg_factory: model.ConfigFactory,
     cfg_queue_entry: CfgQueueEntry,
 ) -> model.aws.AwsProfile | None:
-    rotation_cfg = rotation_cfg_or_none(
-        aws_cfg=cfg_element,
-        cfg_factory=cfg_factory,
-    ) or cfg_element
+    # prefer the rotation-cfg recorded upon rotation (avoids re-resolving the reference);
+    # older queue-entries do not carry it - fall back to resolving in that case
+    if (rotation_cfg_ref := cfg_queue_entry.secretId.get('rotation_cfg')):
+        rotation_cfg = cfg_factory._cfg_element(
+            cfg_type_name=rotation_cfg_ref['type_name'],
+            cfg_name=rotation_cfg_ref['element_name'],
+        )
+    else:
+        rotation_cfg = rotation_cfg_or_none(
+            aws_cfg=cfg_element,
+            cfg_factory=cfg_factory,
+        ) or cfg_element
 
     logger.info(f'using {rotation_cfg.name()=} for deletion')
 
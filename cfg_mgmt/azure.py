@@ -1,4 +1,3 @@
-import copy
 import dataclasses
 import dateutil.parser
 import typing
@@ -157,7 +156,9 @@ def rotate_cfg_element(
         access_token=access_token,
     )
 
-    raw_cfg = copy.deepcopy(cfg_element.raw)
+    # shallow copy suffices: only top-level keys are replaced (no in-place mutation of
+    # nested containers)
+    raw_cfg = {**cfg_element.raw}
     new_element = model.azure.AzureServicePrincipal(
         name=cfg_element.name(), raw_dict=raw_cfg, type_name=cfg_element._type_name
     )
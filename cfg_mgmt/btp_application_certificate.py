@@ -1,4 +1,3 @@
-import copy
 import logging
 import typing
 import requests
@@ -247,7 +246,9 @@ def rotate_cfg_element(
     )
 
     secret_id = {'common_name': cn}
-    raw_cfg = copy.deepcopy(cfg_element.raw)
+    # shallow copy suffices: only top-level keys are replaced (no in-place mutation of
+    # nested containers)
+    raw_cfg = {**cfg_element.raw}
     raw_cfg['certificate_pem'] = cert_pem
     raw_cfg['private_key_pem'] = key_pem
     raw_cfg['common_name'] = next_cn
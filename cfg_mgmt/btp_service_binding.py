@@ -1,4 +1,3 @@
-import copy
 import logging
 import typing
 import requests
@@ -213,7 +212,9 @@ def rotate_cfg_element(
     created_binding = client.create_service_binding(instance_id, binding_name)
 
     secret_id = {'binding_id': old_binding_id, 'binding_name': old_binding_name}
-    raw_cfg = copy.deepcopy(cfg_element.raw)
+    # shallow copy suffices: only top-level keys are replaced (no in-place mutation of
+    # nested containers)
+    raw_cfg = {**cfg_element.raw}
     raw_cfg['credentials'] = created_binding.credentials
     raw_cfg['binding_id'] = created_binding.id
     raw_cfg['binding_name'] = binding_name
@@ -1,5 +1,4 @@
 import base64
-import copy
 import json
 import logging
 import typing
@@ -100,7 +99,9 @@ def rotate_cfg_element(
         service_account_name=service_account_name,
     )
 
-    raw_cfg = copy.deepcopy(cfg_element.raw)
+    # shallow copy suffices: only top-level keys are replaced (no in-place mutation of
+    # nested containers)
+    raw_cfg = {**cfg_element.raw}
 
     if isinstance(cfg_element, model.container_registry.ContainerRegistryConfig):
         raw_cfg['password'] = json.dumps(new_key)
@@ -118,6 +119,14 @@ def rotate_cfg_element(
 
     secret_id = {'gcp_secret_key': old_key_id}
 
+    if rotation_cfg is not cfg_element:
+        # remember which cfg-element was used for rotation, so the (later) deletion of the old
+        # key does not have to re-resolve the reference
+        secret_id['rotation_cfg'] = {
+            'type_name': rotation_cfg._type_name,
+            'element_name': rotation_cfg.name(),
+        }
+
     def revert():
         delete_service_account_key(
             iam_client=iam_client,
@@ -135,10 +144,18 @@ def delete_config_secret(
     cfg_queue_entry: cmm.CfgQueueEntry,
     cfg_factory: model.ConfigFactory,
 ) -> GcpServiceAccount | None:
-    rotation_cfg = rotation_cfg_or_none(
-        gcp_cfg=cfg_element,
-        cfg_factory=cfg_factory,
-    ) or cfg_element
+    # prefer the rotation-cfg recorded upon rotation (avoids re-resolving the reference);
+    # older queue-entries do not carry it - fall back to resolving in that case
+    if (rotation_cfg_ref := cfg_queue_entry.secretId.get('rotation_cfg')):
+        rotation_cfg = cfg_factory._cfg_element(
+            cfg_type_name=rotation_cfg_ref['type_name'],
+            cfg_name=rotation_cfg_ref['element_name'],
+        )
+    else:
+        rotation_cfg = rotation_cfg_or_none(
+            gcp_cfg=cfg_element,
+            cfg_factory=cfg_factory,
+        ) or cfg_element
 
     logger.info(f'using {rotation_cfg.name()=} for deletion')
 
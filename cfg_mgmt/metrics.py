@@ -119,13 +119,16 @@ class CcCfgComplianceResponsible:
 def index_name(
     obj: typing.Union[CcCfgComplianceStatus, CcCfgComplianceResponsible],
 ) -> str:
-    if isinstance(obj, CcCfgComplianceResponsible):
+    # accept both instances and classes
+    cls = obj if isinstance(obj, type) else type(obj)
+
+    if issubclass(cls, CcCfgComplianceResponsible):
         return 'cc_cfg_compliance_responsible'
 
-    if isinstance(obj, CcCfgComplianceStatus):
+    if issubclass(cls, CcCfgComplianceStatus):
         return 'cc_cfg_compliance_status'
 
-    if isinstance(obj, CcCfgComplianceStorageResponsibles):
+    if issubclass(cls, CcCfgComplianceStorageResponsibles):
         return 'cc_cfg_compliance_storage_responsibles'
 
     raise NotImplementedError(obj)
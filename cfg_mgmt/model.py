@@ -1,7 +1,7 @@
 import dataclasses
 import datetime
-import dateutil.parser
 import enum
+import functools
 import os
 import re
 import typing
@@ -67,6 +67,16 @@ class CfgTarget:
     type: str
     name: str
 
+    # type/name are regex-patterns; matches() is called once per (target, element)-combination
+    # when determining statuses, so compile each pattern only once per target
+    @functools.cached_property
+    def _type_regex(self) -> re.Pattern:
+        return re.compile(self.type)
+
+    @functools.cached_property
+    def _name_regex(self) -> re.Pattern:
+        return re.compile(self.name)
+
     def matches(
         self,
         element: typing.Union[str, mb.NamedModelElement],
@@ -94,12 +104,12 @@ class CfgTarget:
             element_name = ci.util.check_type(element, str)
             element_type = ci.util.check_type(type, str)
 
-        type_matches = re.fullmatch(self.type, element_type)
+        type_matches = self._type_regex.fullmatch(element_type)
 
         if not type_matches:
             return False
 
-        name_matches = re.fullmatch(self.name, element_name)
+        name_matches = self._name_regex.fullmatch(element_name)
 
         if not name_matches:
             return False
@@ -145,11 +155,17 @@ class CfgQueueEntry:
     deleteAfter: str
     secretId: dict
 
+    @functools.cached_property
+    def _delete_after(self) -> datetime.datetime:
+        # deleteAfter is written as iso-formatted date (see create_config_queue_entry);
+        # parse lazily, but only once per entry
+        return datetime.datetime.fromisoformat(self.deleteAfter)
+
     def to_be_deleted(
         self,
         timestamp: datetime.datetime,
     ) -> bool:
-        return timestamp > dateutil.parser.isoparse(self.deleteAfter)
+        return timestamp > self._delete_after
 
 
 @dataclasses.dataclass
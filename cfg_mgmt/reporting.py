@@ -1,3 +1,4 @@
+import datetime
 import logging
 import typing
 
@@ -16,6 +17,19 @@ ci.log.configure_default_logging()
 logger = logging.getLogger(__name__)
 
 
+def _parse_credential_update_timestamp(timestamp: str) -> datetime.datetime:
+    '''parses credential-update-timestamps (iso-formatted dates, written by
+    cfg_mgmt.util.update_config_status)
+
+    prefer the (considerably faster) stdlib-parser; fall back to dateutil for
+    legacy values it does not understand
+    '''
+    try:
+        return datetime.datetime.fromisoformat(timestamp)
+    except ValueError:
+        return dp.isoparse(timestamp)
+
+
 def evaluate_cfg_element_status(
     cfg_element_status: cmm.CfgElementStatusReport,
 ) -> cmm.CfgStatusEvaluationResult:
@@ -62,7 +76,9 @@ def evaluate_cfg_element_status(
                 non_compliant_reasons.append(cmm.CfgElementPolicyViolation.NO_STATUS)
 
             else:
-                last_update = dp.isoparse(status.credential_update_timestamp)
+                last_update = _parse_credential_update_timestamp(
+                    status.credential_update_timestamp,
+                )
 
                 if policy.check(last_update=last_update, honour_grace_period=True):
                     credentials_outdated = False
@@ -269,63 +285,62 @@ def cfg_compliance_status_to_es(
     es_client: ccc.elasticsearch.ElasticSearchClient,
     cfg_report_summary_gen: typing.Generator[cmm.CfgStorageSummary, None, None],
 ):
-    for cfg_report_summary in cfg_report_summary_gen:
-        cc_cfg_compliance_status = cfg_mgmt.metrics.CcCfgComplianceStatus.create(
-            url=cfg_report_summary.url,
-            compliant_count=cfg_report_summary.compliantElementsCount,
-            non_compliant_count=cfg_report_summary.noncompliantElementsCount,
-        )
-
-        ccc.elasticsearch.metric_to_es(
-            es_client=es_client,
-            metric=cc_cfg_compliance_status,
-            index_name=cfg_mgmt.metrics.index_name(cc_cfg_compliance_status),
-        )
+    ccc.elasticsearch.metrics_to_es(
+        es_client=es_client,
+        metrics=(
+            cfg_mgmt.metrics.CcCfgComplianceStatus.create(
+                url=cfg_report_summary.url,
+                compliant_count=cfg_report_summary.compliantElementsCount,
+                non_compliant_count=cfg_report_summary.noncompliantElementsCount,
+            ) for cfg_report_summary in cfg_report_summary_gen
+        ),
+        index_name=cfg_mgmt.metrics.index_name(cfg_mgmt.metrics.CcCfgComplianceStatus),
+    )
 
 
 def cfg_compliance_storage_responsibles_to_es(
     es_client: ccc.elasticsearch.ElasticSearchClient,
     cfg_responsible_summary_gen: typing.Generator[cmm.CfgResponsibleSummary, None, None],
 ):
-    for cfg_responsible_sum in cfg_responsible_summary_gen:
-        cc_cfg_compliance_storage_responsibles = \
+    ccc.elasticsearch.metrics_to_es(
+        es_client=es_client,
+        metrics=(
             cfg_mgmt.metrics.CcCfgComplianceStorageResponsibles.create(
-            url=cfg_responsible_sum.url,
-            compliant_count=cfg_responsible_sum.compliantElementsCount,
-            non_compliant_count=cfg_responsible_sum.noncompliantElementsCount,
-            responsible=cfg_responsible_sum.responsible,
-        )
-
-        ccc.elasticsearch.metric_to_es(
-            es_client=es_client,
-            metric=cc_cfg_compliance_storage_responsibles,
-            index_name=cfg_mgmt.metrics.index_name(cc_cfg_compliance_storage_responsibles),
-        )
+                url=cfg_responsible_sum.url,
+                compliant_count=cfg_responsible_sum.compliantElementsCount,
+                non_compliant_count=cfg_responsible_sum.noncompliantElementsCount,
+                responsible=cfg_responsible_sum.responsible,
+            ) for cfg_responsible_sum in cfg_responsible_summary_gen
+        ),
+        index_name=cfg_mgmt.metrics.index_name(
+            cfg_mgmt.metrics.CcCfgComplianceStorageResponsibles,
+        ),
+    )
 
 
 def cfg_compliance_responsibles_to_es(
     es_client: ccc.elasticsearch.ElasticSearchClient,
     cfg_element_statuses: typing.Iterable[cmm.CfgElementStatusReport],
 ):
-    for cfg_element_status in cfg_element_statuses:
-
-        status_evaluation = evaluate_cfg_element_status(cfg_element_status)
-
-        cc_cfg_compliance_responsible = cfg_mgmt.metrics.CcCfgComplianceResponsible.create(
-            element_name=cfg_element_status.element_name,
-            element_type=cfg_element_status.element_type,
-            element_storage=cfg_element_status.element_storage,
-            is_compliant=status_evaluation.fullyCompliant,
-            responsible=cfg_element_status.responsible,
-            rotation_method=cfg_element_status.policy.rotation_method,
-            non_compliant_reasons=status_evaluation.nonCompliantReasons,
-        )
+    def iter_metrics():
+        for cfg_element_status in cfg_element_statuses:
+            status_evaluation = evaluate_cfg_element_status(cfg_element_status)
+
+            yield cfg_mgmt.metrics.CcCfgComplianceResponsible.create(
+                element_name=cfg_element_status.element_name,
+                element_type=cfg_element_status.element_type,
+                element_storage=cfg_element_status.element_storage,
+                is_compliant=status_evaluation.fullyCompliant,
+                responsible=cfg_element_status.responsible,
+                rotation_method=cfg_element_status.policy.rotation_method,
+                non_compliant_reasons=status_evaluation.nonCompliantReasons,
+            )
 
-        ccc.elasticsearch.metric_to_es(
-            es_client=es_client,
-            metric=cc_cfg_compliance_responsible,
-            index_name=cfg_mgmt.metrics.index_name(cc_cfg_compliance_responsible),
-        )
+    ccc.elasticsearch.metrics_to_es(
+        es_client=es_client,
+        metrics=iter_metrics(),
+        index_name=cfg_mgmt.metrics.index_name(cfg_mgmt.metrics.CcCfgComplianceResponsible),
+    )
 
 
 def iter_cfg_elements_requiring_rotation(
@@ -335,6 +350,8 @@ def iter_cfg_elements_requiring_rotation(
     element_filter: typing.Callable[[model.NamedModelElement], bool]=None,
     rotation_method: cmm.RotationMethod=None,
 ) -> typing.Generator[model.NamedModelElement, None, None]:
+    policies_by_name = {policy.name: policy for policy in cfg_metadata.policies}
+
     for cfg_element in cfg_elements:
         if cfg_target and not cfg_target.matches(element=cfg_element):
             continue
@@ -348,6 +365,7 @@ def iter_cfg_elements_requiring_rotation(
             rules=cfg_metadata.rules,
             responsibles=cfg_metadata.responsibles,
             statuses=cfg_metadata.statuses,
+            policies_by_name=policies_by_name,
         )
 
         # hardcode rule: ignore elements w/o rule and policy
@@ -366,7 +384,9 @@ def iter_cfg_elements_requiring_rotation(
             yield cfg_element
             continue
 
-        last_update = dp.isoparse(status.status.credential_update_timestamp)
+        last_update = _parse_credential_update_timestamp(
+            status.status.credential_update_timestamp,
+        )
         if status.policy.check(last_update=last_update, honour_grace_period=False):
             continue
         else:
@@ -376,7 +396,7 @@ def iter_cfg_elements_requiring_rotation(
 def generate_cfg_element_status_reports(
     cfg_dir: str,
     element_storage: str | None=None,
-) -> list[cmm.CfgElementStatusReport]:
+) -> typing.Generator[cmm.CfgElementStatusReport, None, None]:
     '''
     If not passed explicitly, the element_storage defaults to cfg_dir.
     '''
@@ -397,7 +417,11 @@ def generate_cfg_element_status_reports(
     if not element_storage:
         element_storage = cfg_dir
 
-    return [
+    policies_by_name = {policy.name: policy for policy in policies}
+
+    # yield lazily - reports are typically streamed (e.g. towards elasticsearch), so avoid
+    # holding all of them in memory at once
+    yield from (
         cmu.determine_status(
             element=element,
             policies=policies,
@@ -405,5 +429,6 @@ def generate_cfg_element_status_reports(
             statuses=statuses,
             responsibles=responsibles,
             element_storage=element_storage,
+            policies_by_name=policies_by_name,
         ) for element in cmu.iter_cfg_elements(cfg_factory=cfg_factory)
-    ]
+    )
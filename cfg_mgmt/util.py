@@ -1,5 +1,6 @@
 import dataclasses
 import datetime
+import functools
 import logging
 import os
 import typing
@@ -7,6 +8,7 @@ import typing
 import pytimeparse
 import ruamel.yaml
 import ruamel.yaml.scalarstring
+import yaml
 
 import cfg_mgmt.model as cmm
 import cfg_mgmt.rotate as cmro
@@ -19,25 +21,44 @@ import model.base
 logger = logging.getLogger(__name__)
 
 
-def iter_cfg_elements(
+@functools.lru_cache(maxsize=4)
+def _all_cfg_elements(
     cfg_factory: typing.Union[model.ConfigFactory, model.ConfigurationSet],
-    cfg_target: typing.Optional[cmm.CfgTarget] = None,
-):
+) -> tuple[model.NamedModelElement, ...]:
+    '''materialises all cfg-elements of the given factory (or cfg-set) once per run
+
+    repeated iterations (status-reports, rotation-checks, ..) would otherwise re-parse
+    the underlying cfg-files for each pass.
+    '''
     if isinstance(cfg_factory, model.ConfigurationSet):
         type_names = cfg_factory.cfg_factory._cfg_types().keys()
     else:
         type_names = cfg_factory._cfg_types().keys()
 
+    cfg_elements = []
     for type_name in type_names:
         # workaround: cfg-sets may reference non-local cfg-elements
         # also, cfg-elements only contain references to other cfg-elements
         # -> policy-checks will only add limited value
         if type_name == 'cfg_set':
             continue
-        for cfg_element in cfg_factory._cfg_elements(cfg_type_name=type_name):
-            if cfg_target and not cfg_target.matches(cfg_element):
-                continue
-            yield cfg_element
+        cfg_elements.extend(cfg_factory._cfg_elements(cfg_type_name=type_name))
+
+    return tuple(cfg_elements)
+
+
+def invalidate_cfg_element_cache():
+    _all_cfg_elements.cache_clear()
+
+
+def iter_cfg_elements(
+    cfg_factory: typing.Union[model.ConfigFactory, model.ConfigurationSet],
+    cfg_target: typing.Optional[cmm.CfgTarget] = None,
+):
+    for cfg_element in _all_cfg_elements(cfg_factory=cfg_factory):
+        if cfg_target and not cfg_target.matches(cfg_element):
+            continue
+        yield cfg_element
 
 
 def iter_cfg_queue_entries_to_be_deleted(
@@ -55,6 +76,25 @@ def iter_cfg_queue_entries_to_be_deleted(
         yield cfg_queue_entry
 
 
+# use libyaml-backed dumper if available (significantly faster for large documents)
+_SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def _write_yaml_file(
+    path: str,
+    data: dict,
+):
+    '''dumps the given (plain) data to the given path (atomically, via temp-file + rename)'''
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        yaml.dump(
+            data=data,
+            stream=f,
+            Dumper=_SafeDumper,
+        )
+    os.replace(tmp_path, path)
+
+
 def create_config_queue_entry(
     queue_entry_config_element: model.NamedModelElement,
     queue_entry_data: dict,
@@ -66,9 +106,9 @@ def create_config_queue_entry(
             type=queue_entry_config_element._type_name,
         ),
         deleteAfter=(
-            datetime.datetime.today()
+            datetime.date.today()
             + datetime.timedelta(seconds=pytimeparse.parse(delete_after_period))
-        ).date().isoformat(),
+        ).isoformat(),
         secretId=queue_entry_data,
     )
 
@@ -78,34 +118,37 @@ def update_config_status(
     config_element: model.NamedModelElement,
     config_statuses: typing.Iterable[cmm.CfgStatus],
 ):
+    today_iso = datetime.date.today().isoformat()
+
     for cfg_status in config_statuses:
         if cfg_status.matches(
             element=config_element,
         ):
+            if cfg_status.credential_update_timestamp == today_iso:
+                return # already up-to-date - skip redundant file write
+            cfg_status.credential_update_timestamp = today_iso
             break
     else:
         # does not exist
-        cfg_status = cmm.CfgStatus(
-            target=cmm.CfgTarget(
-                type=config_element._type_name,
-                name=config_element.name(),
-            ),
-            credential_update_timestamp=datetime.date.today().isoformat(),
+        config_statuses.append(
+            cmm.CfgStatus(
+                target=cmm.CfgTarget(
+                    type=config_element._type_name,
+                    name=config_element.name(),
+                ),
+                credential_update_timestamp=today_iso,
+            )
         )
-        config_statuses.append(cfg_status)
-    cfg_status.credential_update_timestamp = datetime.date.today().isoformat()
 
-    yaml = ruamel.yaml.YAML()
-    with open(cfg_status_file_path, 'w') as f:
-        yaml.dump(
-            {
-                'config_status': [
-                    dataclasses.asdict(cfg_status)
-                    for cfg_status in config_statuses
-                ]
-            },
-            f,
-        )
+    _write_yaml_file(
+        path=cfg_status_file_path,
+        data={
+            'config_status': [
+                dataclasses.asdict(cfg_status)
+                for cfg_status in config_statuses
+            ]
+        },
+    )
 
 
 def write_config_queue(
@@ -113,17 +156,15 @@ def write_config_queue(
     cfg_metadata: cmm.CfgMetadata,
     queue_file_name: str=cmm.cfg_queue_fname,
 ):
-    yaml = ruamel.yaml.YAML()
-    with open(os.path.join(cfg_dir, queue_file_name), 'w') as queue_file:
-        yaml.dump(
-            {
-                'rotation_queue': [
-                    dataclasses.asdict(cfg_queue_entry)
-                    for cfg_queue_entry in cfg_metadata.queue
-                ],
-            },
-            queue_file,
-        )
+    _write_yaml_file(
+        path=os.path.join(cfg_dir, queue_file_name),
+        data={
+            'rotation_queue': [
+                dataclasses.asdict(cfg_queue_entry)
+                for cfg_queue_entry in cfg_metadata.queue
+            ],
+        },
+    )
 
 
 def local_cfg_type_sources(
@@ -386,7 +427,11 @@ def determine_status(
     responsibles: list[cmm.CfgResponsibleMapping],
     statuses: list[cmm.CfgStatus],
     element_storage: str=None,
+    policies_by_name: dict[str, cmm.CfgPolicy]=None, # may be precomputed by iterating callers
 ) -> cmm.CfgElementStatusReport:
+    if policies_by_name is None:
+        policies_by_name = {policy.name: policy for policy in policies}
+
     for rule in rules:
         if rule.matches(element=element):
             break
@@ -396,10 +441,8 @@ def determine_status(
     rule: typing.Optional[cmm.CfgRule]
 
     if rule:
-        for policy in policies:
-            if policy.name == rule.policy:
-                break
-        else:
+        policy = policies_by_name.get(rule.policy)
+        if policy is None:
             rule = None # inconsistent cfg: rule with specified name does not exist
     else:
         policy = None
@@ -226,6 +226,10 @@ def not_none(value):
     return value
 
 
+# use libyaml-backed loader if available (significantly faster for large documents)
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 def load_yaml(stream, lint=False, linter_config=None):
     '''
     Parses YAML from the given stream in a (by default) safe manner.
@@ -243,7 +247,7 @@ def load_yaml(stream, lint=False, linter_config=None):
         linting_result = LintingResult(yamllint.linter.run(input=stream, conf=linter_config))
         _print_linting_findings(linting_result)
 
-    parsed = yaml.safe_load(stream)
+    parsed = yaml.load(stream, Loader=_SafeLoader)
     _count_elements(parsed)
     return parsed
 
@@ -259,7 +263,7 @@ def parse_yaml_file(
         lint_yaml_file(path)
 
     with open(path) as f:
-        parsed = yaml.load(f, Loader=yaml.SafeLoader)
+        parsed = yaml.load(f, Loader=_SafeLoader)
         # mitigate yaml bomb
         _count_elements(parsed)
         return parsed
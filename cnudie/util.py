@@ -370,20 +370,16 @@ def diff_components(
         c for c in right_components if c.identity() in right_only_component_identities
     ))
 
-    def find_changed_component(
-        changed_component: cm.Component,
-        components: typing.List[cm.Component],
-    ):
-        for c in components:
-            if c.name == changed_component.name:
-                return (changed_component, c)
-        return (changed_component, None) # no pair component found
+    # index by name once (first occurrence wins, as the previous linear scan did) instead
+    # of re-scanning right_components per left component
+    right_components_by_name = {}
+    for c in right_components:
+        right_components_by_name.setdefault(c.name, c)
 
     components_with_changed_versions = []
     for component in left_components:
-        changed_component = find_changed_component(component, right_components)
-        if changed_component[1] is not None:
-            components_with_changed_versions.append(changed_component)
+        if (right_component := right_components_by_name.get(component.name)) is not None:
+            components_with_changed_versions.append((component, right_component))
 
     left_component_names = {i.name for i in left_component_identities}
     right_component_names = {i.name for i in right_component_identities}
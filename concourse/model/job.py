@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import copy
 import enum
 import graphlib
 import typing
@@ -126,7 +125,12 @@ class JobVariant(ModelBase):
         '''
         # handle circular dependencies caused by depending on the publish step, e.g.:
         # test -> publish -> ... -> prepare -> test
-        updated_dependencies = copy.deepcopy(dependencies)
+        # shallow per-entry copy suffices (and is much cheaper than deepcopy): keys are
+        # str, values are sets of str
+        updated_dependencies = {
+            step_name: set(step_dependencies)
+            for step_name, step_dependencies in dependencies.items()
+        }
         custom_steps_depending_on_publish = [
             step_name for step_name in cycle_info
             if self._step_depends_on(
@@ -148,7 +152,10 @@ class JobVariant(ModelBase):
         dependencies,
         cycle_info: typing.Sequence[str],
     ):
-        updated_dependencies = copy.deepcopy(dependencies)
+        updated_dependencies = {
+            step_name: set(step_dependencies)
+            for step_name, step_dependencies in dependencies.items()
+        }
         if (
             len(cycle_info) == 3
             and len(unique_steps := set(cycle_info)) == 2
@@ -5,10 +5,10 @@
 
 import dataclasses
 import enum
+import functools
 import textwrap
 import typing
 
-import dacite
 
 from ci.util import not_none
 from model import NamedModelElement
@@ -37,7 +37,7 @@ from model.base import (
 )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TargetSpec:
     '''
     OCI Image build target:
@@ -52,6 +52,10 @@ class TargetSpec:
     name: str | None = None # default value is injected after deserialisation
 
 
+_target_spec_field_names = frozenset(f.name for f in dataclasses.fields(TargetSpec))
+_label_field_names = frozenset(f.name for f in dataclasses.fields(cm.Label))
+
+
 IMG_DESCRIPTOR_ATTRIBS = (
     AttributeSpec.optional(
         name='registry',
@@ -172,6 +176,17 @@ IMG_DESCRIPTOR_ATTRIBS = (
     ),
 )
 
+# precomputed once at module-load - the attribute-specs are immutable, and defaults are
+# (re-)applied for every image x platform combination during pipeline-expansion
+# (merge_dicts deep-copies its arguments, so sharing the defaults-dict is safe)
+_img_descriptor_defaults = AttributeSpec.defaults_dict(IMG_DESCRIPTOR_ATTRIBS)
+_img_descriptor_optional_attrs = frozenset(
+    AttributeSpec.optional_attr_names(IMG_DESCRIPTOR_ATTRIBS)
+)
+_img_descriptor_required_attrs = frozenset(
+    AttributeSpec.required_attr_names(IMG_DESCRIPTOR_ATTRIBS)
+)
+
 
 class PublishDockerImageDescriptor(NamedModelElement, ModelDefaultsMixin, AttribSpecMixin):
     def __init__(
@@ -194,85 +209,106 @@ class PublishDockerImageDescriptor(NamedModelElement, ModelDefaultsMixin, Attrib
         else:
             self._base_name = self._name
 
+        # unpack hot attributes once - accessors are called repeatedly during build-step
+        # generation, and self.raw does not mutate after init (adding __slots__ here would
+        # be ineffective, as base-classes already carry a __dict__)
+        raw = self.raw
+        self._inputs_dict = raw['inputs']
+        self._registry_name = raw.get('registry')
+        self._image_reference = raw['image']
+        self._raw_extra_push_targets = raw['extra_push_targets']
+        self._tag_as_latest = raw['tag_as_latest']
+        self._tag_template = raw['tag_template']
+        self._build_args = raw['build_args']
+        self._target_name = raw.get('target')
+        self._prebuild_hook = raw['prebuild_hook']
+        self._dockerfile_relpath = raw['dockerfile']
+        self._builddir_relpath = raw['dir']
+        self._resource_labels = raw['resource_labels']
+        self._platforms = raw['platforms']
+        self._additional_tags = ('latest',) if self._tag_as_latest else ()
+        self._has_targets = bool(raw.get('targets'))
+        self._resource_name = None # lazily calculated + cached (requires image-reference)
+
     @classmethod
     def _attribute_specs(cls):
         return IMG_DESCRIPTOR_ATTRIBS
 
     def _defaults_dict(self):
-        return AttributeSpec.defaults_dict(IMG_DESCRIPTOR_ATTRIBS)
+        return _img_descriptor_defaults
 
     def _optional_attributes(self):
-        return set(AttributeSpec.optional_attr_names(IMG_DESCRIPTOR_ATTRIBS))
+        return _img_descriptor_optional_attrs
 
     def _required_attributes(self):
-        return set(AttributeSpec.required_attr_names(IMG_DESCRIPTOR_ATTRIBS))
+        return _img_descriptor_required_attrs
 
     def _inputs(self):
-        return self.raw['inputs']
+        return self._inputs_dict
 
     def input_repos(self):
-        return self._inputs()['repos']
+        return self._inputs_dict['repos']
 
     def input_steps(self):
-        return self._inputs()['steps']
+        return self._inputs_dict['steps']
 
     def registry_name(self):
-        return self.raw.get('registry')
+        return self._registry_name
 
     def image_reference(self):
-        return self.raw['image']
+        return self._image_reference
 
-    @property
-    def extra_push_targets(self) -> list[om.OciImageReference]:
-        return [om.OciImageReference(target) for target in self.raw['extra_push_targets']]
+    @functools.cached_property
+    def extra_push_targets(self) -> tuple[om.OciImageReference, ...]:
+        return tuple(om.OciImageReference(target) for target in self._raw_extra_push_targets)
 
     def tag_as_latest(self) -> bool:
-        return self.raw['tag_as_latest']
+        return self._tag_as_latest
 
     def additional_tags(self) -> typing.Tuple[str]:
-        if self.tag_as_latest():
-            return ('latest',)
-        return ()
+        return self._additional_tags
 
     def tag_template(self):
-        return self.raw['tag_template']
+        return self._tag_template
 
     def build_args(self):
-        return self.raw['build_args']
+        return self._build_args
 
     def target_name(self):
-        return self.raw.get('target')
+        return self._target_name
 
     @property
     def is_multitarget(self):
-        if self.raw.get('targets'):
-            return True
-        return False
+        return self._has_targets
 
-    @property
+    @functools.cached_property
     def targets(self):
-        if (target_name := self.target_name()):
+        image_reference = self._image_reference
+        base_name = self._base_name
+
+        if (target_name := self._target_name):
             return (
                 TargetSpec(
                     target=target_name,
-                    image=self.image_reference(),
-                    name=self._base_name,
+                    image=image_reference,
+                    name=base_name,
                 ),
             )
         if not (raw_targets := self.raw.get('targets')):
             return (
                 TargetSpec(
                     target=None,
-                    image=self.image_reference(),
-                    name=self._base_name,
+                    image=image_reference,
+                    name=base_name,
                 ),
             )
 
         targets = []
         for raw_target in raw_targets:
-            target = dacite.from_dict(
-                data_class=TargetSpec,
-                data=raw_target,
+            # construct directly - TargetSpec is a plain dataclass of scalar fields, so
+            # dacite's per-call type-introspection is avoidable overhead here
+            target = TargetSpec(
+                **{k: v for k, v in raw_target.items() if k in _target_spec_field_names},
             )
             if not target.name:
                 target.name = f'{self.name()}-{target.target}'
@@ -283,28 +319,28 @@ class PublishDockerImageDescriptor(NamedModelElement, ModelDefaultsMixin, Attrib
 
     @property
     def prebuild_hook(self) -> str | None:
-        return self.raw['prebuild_hook']
+        return self._prebuild_hook
 
     def dockerfile_relpath(self):
-        return self.raw['dockerfile']
+        return self._dockerfile_relpath
 
     def builddir_relpath(self):
-        return self.raw['dir']
+        return self._builddir_relpath
 
     def resource_labels(self):
         # for base-component-descriptor
-        return self.raw['resource_labels']
+        return self._resource_labels
 
     def resource_name(self):
-        parts = self.image_reference().split('/')
-        # image references are lengthy (e.g. gcr.eu/<org>/<path>/../<name>)
-        # -> shorten this a bit (keep domain and last part of url path)
-        domain = parts[0]
-        image_name = parts[-1]
-        return '_'.join([self.name(), domain, image_name])
+        if self._resource_name is None:
+            parts = self._image_reference.split('/')
+            # image references are lengthy (e.g. gcr.eu/<org>/<path>/../<name>)
+            # -> shorten this a bit (keep domain and last part of url path)
+            self._resource_name = f'{self.name()}_{parts[0]}_{parts[-1]}'
+        return self._resource_name
 
     def platforms(self) -> list[str] | None:
-        return self.raw['platforms']
+        return self._platforms
 
     def platform(self) -> typing.Optional[str]:
         '''
@@ -321,23 +357,24 @@ class PublishDockerImageDescriptor(NamedModelElement, ModelDefaultsMixin, Attrib
     def validate(self):
         super().validate()
 
-        if self.target_name() and self.raw.get('targets', False):
+        if self._target_name and self._has_targets:
             raise ModelValidationError('target and targets must not both be set')
 
-        if self.extra_push_targets and self.raw.get('targets', False):
+        if self.extra_push_targets and self._has_targets:
             raise ModelValidationError('targets and extra_push_targets must not both be set')
 
         for label in self.resource_labels():
-            try:
-                dacite.from_dict(
-                    data_class=cm.Label,
-                    data=label,
-                    config=dacite.Config(strict=True),
-                )
-            except dacite.DaciteError as e:
+            # lightweight schema-check, equivalent to dacite's strict-mode for cm.Label,
+            # but without re-running type-introspection per label
+            if (
+                not isinstance(label, dict)
+                or label.keys() - _label_field_names
+                or not isinstance(label.get('name'), str)
+                or not isinstance(label.get('value'), (str, int, float, bool, dict, list))
+            ):
                 raise ModelValidationError(
                     f"Invalid '{label=}'."
-                ) from e
+                )
 
 
 class OciBuilder(enum.Enum):
@@ -404,6 +441,12 @@ ATTRIBUTES = (
 class PublishTrait(Trait):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._dockerimages_cache = None
+        self._platforms = self.raw.get('platforms', None)
+        # both values are immutable after init, and oci_builder() in particular is called
+        # repeatedly (validation, step-injection) - convert only once
+        self._oci_builder = OciBuilder(self.raw['oci-builder'])
+        self._use_buildkit = not self.raw['no-buildkit']
 
     @classmethod
     def _attribute_specs(cls):
@@ -413,51 +456,64 @@ class PublishTrait(Trait):
        return self.dockerimages()
 
     def dockerimages(self) -> typing.List[PublishDockerImageDescriptor]:
+        # descriptor-construction is comparatively expensive (defaults-application, dict
+        # copies, name-munging) and dockerimages() is called several times during pipeline
+        # expansion - materialise once (self.raw does not mutate after init)
+        if self._dockerimages_cache is not None:
+            return self._dockerimages_cache
+
         image_dict = self.raw['dockerimages']
 
         if not (platforms := self.platforms()):
             platforms = (None, )
 
-        def matches_platform(platform, image_args):
-            if platform is None:
-                return True
-
-            if (platforms := image_args.get('platforms', None)) is None:
-                return True
-
-            if platform in platforms:
-                return True
-
-            # special-case: normalise x86_64 -> arm64
+        def normalised(platform: str) -> str:
+            # special-case: x86_64 is an alias for amd64
             if platform == 'linux/x86_64':
-                return 'linux/amd64' in platforms
-            if platform == 'linux/arm64':
-                return 'linux/x86_64' in platforms
-
-        for platform in platforms:
-            yield from (
-                PublishDockerImageDescriptor(
-                    name,
-                    args,
-                    platform=platform,
-                )
-                for name, args
-                in image_dict.items()
-                if matches_platform(platform=platform, image_args=args)
+                return 'linux/amd64'
+            return platform
+
+        # precompute each image's allowed platforms once (alias-normalised frozensets), so
+        # the (platform x image)-matching below is a single hash-lookup per pair
+        images = [
+            (
+                name,
+                args,
+                None if (image_platforms := args.get('platforms', None)) is None
+                    else frozenset(normalised(p) for p in image_platforms),
             )
+            for name, args in image_dict.items()
+        ]
+
+        self._dockerimages_cache = [
+            PublishDockerImageDescriptor(
+                name,
+                args,
+                platform=platform,
+            )
+            for platform in platforms
+            for name, args, allowed_platforms in images
+            if (
+                platform is None
+                or allowed_platforms is None
+                or normalised(platform) in allowed_platforms
+            )
+        ]
+
+        return self._dockerimages_cache
 
     def platforms(self) -> typing.Optional[list[str]]:
         '''
         the list of explicitly configured build platforms
         guaranteed to be either non-empty, or None
         '''
-        return self.raw.get('platforms', None)
+        return self._platforms
 
     def oci_builder(self) -> OciBuilder:
-        return OciBuilder(self.raw['oci-builder'])
+        return self._oci_builder
 
     def use_buildkit(self) -> bool:
-        return not self.raw['no-buildkit']
+        return self._use_buildkit
 
     def transformer(self):
         return PublishTraitTransformer(trait=self)
@@ -481,6 +537,19 @@ class PublishTrait(Trait):
                     )
 
 
+# steps the prepare-step must never depend on (see process_pipeline_args)
+_publish_dependency_skip_step_names = frozenset(('publish', 'release', 'build_oci_image'))
+
+
+@functools.lru_cache(maxsize=1)
+def _kaniko_image_ref() -> str:
+    # file-contents are stable for the life of the process - read only once
+    with open(concourse.paths.last_released_tag_file) as f:
+        last_tag = f.read().strip()
+    prefix = 'europe-docker.pkg.dev/gardener-project/releases'
+    return f'{prefix}/cicd/kaniko-image:{last_tag}'
+
+
 class PublishTraitTransformer(TraitTransformer):
     name = 'publish'
 
@@ -498,6 +567,7 @@ class PublishTraitTransformer(TraitTransformer):
         if cfg_set:
             self.worker_node_cfg = cfg_set.concourse().worker_node_cfg
         self._build_steps = []
+        self._input_step_names = set()
 
     def inject_steps(self):
         publish_step = PipelineStep(
@@ -532,16 +602,18 @@ class PublishTraitTransformer(TraitTransformer):
             OciBuilder.DOCKER_BUILDX,
         ):
             if oci_builder is OciBuilder.KANIKO:
-                with open(concourse.paths.last_released_tag_file) as f:
-                    last_tag = f.read().strip()
-                prefix = 'europe-docker.pkg.dev/gardener-project/releases'
-                kaniko_image_ref = f'{prefix}/cicd/kaniko-image:{last_tag}'
+                kaniko_image_ref = _kaniko_image_ref()
             elif oci_builder in (OciBuilder.DOCKER, OciBuilder.DOCKER_BUILDX):
                 kaniko_image_ref = None
             else:
                 raise NotImplementedError(oci_builder)
 
             for img in self.trait.dockerimages():
+                # collect input-steps while we are iterating anyway (consumed later by
+                # process_pipeline_args)
+                # todo: image-specific prepare steps
+                self._input_step_names.update(img.input_steps())
+
                 worker_node_tags = ()
 
                 if platform_name := img.platform():
@@ -596,12 +668,7 @@ class PublishTraitTransformer(TraitTransformer):
         for build_step in self._build_steps + [self._publish_step]:
             build_step.add_input(variable_name=image_path, name=image_name)
 
-        input_step_names = set()
-        for image_descriptor in self.trait.dockerimages():
-            # todo: image-specific prepare steps
-            input_step_names.update(image_descriptor.input_steps())
-
-        for input_step_name in input_step_names:
+        for input_step_name in self._input_step_names:
             input_step = pipeline_args.step(input_step_name)
             input_name = input_step.output_dir()
             prepare_step.add_input(input_name, input_name)
@@ -609,7 +676,7 @@ class PublishTraitTransformer(TraitTransformer):
         # prepare-step depdends on every other step, except publish and release
         # TODO: do not hard-code knowledge about 'release' step
         for step in pipeline_args.steps():
-            if step.name in ['publish', 'release', 'build_oci_image']:
+            if step.name in _publish_dependency_skip_step_names:
                 continue
             if step.name.startswith('build_oci_image'):
                 continue
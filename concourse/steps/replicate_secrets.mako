@@ -81,10 +81,12 @@ replicate_secrets(
 
 logger.info('generating cfg element status report')
 
-status_reports = cmr.generate_cfg_element_status_reports(
+# materialise - reports are iterated multiple times below (report-creation and the
+# compliance-exporters)
+status_reports = list(cmr.generate_cfg_element_status_reports(
     cfg_dir=cfg_dir,
     element_storage=config_repo_url,
-)
+))
 cmr.create_report(status_reports)
 cfg_report_summary_gen = cmr.cfg_element_statuses_storage_summaries(status_reports)
 cfg_responsible_summary_gen = cmr.cfg_element_statuses_responsible_summaries(status_reports)
@@ -1,4 +1,5 @@
 import base64
+import concurrent.futures
 import logging
 
 import kubernetes.client
@@ -249,7 +250,7 @@ def replicate_secrets(
     cfg_factory: model.ConfigFactory,
     replication_target_config: model.config_repo.ReplicationTargetConfig,
 ):
-    for mapping in replication_target_config.replication_mappings:
+    def replicate_mapping(mapping: model.config_repo.ReplicationMapping):
         cfg_set = cfg_factory.cfg_set(mapping.cfg_set)
         # force cfg_set serialiser to include referenced cfg_sets
         cfg_sets = list(cfg_set._cfg_elements('cfg_set')) + [cfg_set]
@@ -272,3 +273,13 @@ def replicate_secrets(
             )
         else:
             raise NotImplementedError(type(mapping))
+
+    # replication-targets are independent of each other - deploy them concurrently (this is
+    # purely IO-bound work against different clusters / services)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(replicate_mapping, mapping)
+            for mapping in replication_target_config.replication_mappings
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result() # propagate exceptions, if any
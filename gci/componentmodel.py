@@ -110,6 +110,18 @@ class RelativeOciAccess(Access):
     type: AccessType = AccessType.RELATIVE_OCI_REFERENCE
 
 
+# module-level cache (an lru_cache on the bound method would key by - and thus retain -
+# the access-instances; caching by url also shares results between equal urls)
+@functools.lru_cache
+def _normalise_and_parse_repo_url(repo_url: str):
+    parsed = urllib.parse.urlparse(repo_url)
+    if not parsed.scheme:
+        # prepend dummy-schema to properly parse hostname and path (and rm it again later)
+        parsed = urllib.parse.urlparse('dummy://' + repo_url)
+
+    return parsed
+
+
 @dc(frozen=True, kw_only=True)
 class GithubAccess(Access):
     repoUrl: str
@@ -122,14 +134,8 @@ class GithubAccess(Access):
         if not len(parsed.path[1:].split('/')):
             raise ValueError(f'{self.repoUrl=} must have exactly two path components')
 
-    @functools.lru_cache
     def _normalise_and_parse_url(self):
-        parsed = urllib.parse.urlparse(self.repoUrl)
-        if not parsed.scheme:
-            # prepend dummy-schema to properly parse hostname and path (and rm it again later)
-            parsed = urllib.parse.urlparse('dummy://' + self.repoUrl)
-
-        return parsed
+        return _normalise_and_parse_repo_url(self.repoUrl)
 
     def repository_name(self):
         return self._normalise_and_parse_url().path[1:].split('/')[1]
@@ -95,7 +95,11 @@ def component_descriptor_from_tarfileobj(
 ):
     with tarfile.open(fileobj=fileobj, mode='r') as tf:
         component_descriptor_info = tf.getmember(component_descriptor_fname)
-        raw_dict = yaml.safe_load(tf.extractfile(component_descriptor_info).read())
+        # component-descriptors can be large - prefer libyaml-backed loader if available
+        raw_dict = yaml.load(
+            tf.extractfile(component_descriptor_info).read(),
+            Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader),
+        )
 
         logger.debug(raw_dict)
 
@@ -68,9 +68,14 @@ def mount_default_adapter(
     max_pool_size=32, # requests-library default
     flags=AdapterFlag.CACHE|AdapterFlag.RETRY,
     retry_cfg: Retry=_default_retry_cfg,
+    cache: cachecontrol.cache.BaseCache=None, # only used if AdapterFlag.CACHE is set
 ):
     if AdapterFlag.CACHE in flags:
-        adapter_constructor = cachecontrol.CacheControlAdapter
+        adapter_constructor = functools.partial(
+            cachecontrol.CacheControlAdapter,
+            cache=cache,
+            cache_etags=True,
+        )
     else:
         adapter_constructor = HTTPAdapter
 
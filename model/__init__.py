@@ -12,7 +12,6 @@ import urllib.parse
 
 import dacite
 import deprecated
-import github3.exceptions
 import yaml
 
 import ci.log
@@ -136,6 +135,7 @@ class ConfigFactory:
         lookup_cfg_factory,
     ):
         import ccc.github
+        import github3.exceptions
         repo_url = cfg_src.repository_url
         if not '://' in repo_url:
             repo_url = 'https://' + repo_url
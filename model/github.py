@@ -6,13 +6,11 @@
 import enum
 import random
 import re
+import time
 import typing
 
 from urllib.parse import urlparse
 
-import github3.github
-import github3.exceptions
-
 from model.base import (
     BasicCredentials,
     NamedModelElement,
@@ -74,11 +72,25 @@ class GithubConfig(NamedModelElement):
 
         return random.choice(technical_users)
 
+    # cached quota-based credential-selections, keyed by cfg-name; determining remaining
+    # quotas costs one api-request per technical user, so do not re-check too frequently
+    _quota_selection_cache = {} # <cfg-name>: (credentials, monotonic-timestamp)
+    _quota_selection_cache_seconds = 60
+
     def credentials_with_most_remaining_quota(self):
+        import github3.github
+        import github3.exceptions
+
         credentials = self._technical_user_credentials()
         if len(credentials) < 2:
             return credentials[0]
 
+        cached_selection = GithubConfig._quota_selection_cache.get(self.name())
+        if cached_selection:
+            best_credentials, selection_timestamp = cached_selection
+            if time.monotonic() - selection_timestamp < self._quota_selection_cache_seconds:
+                return best_credentials
+
         if self.hostname() == 'github.com':
             ApiCtor = github3.github.GitHub
             api_kwargs = {}
@@ -95,6 +107,8 @@ class GithubConfig(NamedModelElement):
 
         best_credentials = max(credentials, key=rate_limit_remaining)
 
+        GithubConfig._quota_selection_cache[self.name()] = (best_credentials, time.monotonic())
+
         return best_credentials
 
     def _technical_user_credentials(self) -> typing.Iterable["GithubCredentials"]: